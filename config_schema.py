@@ -11,11 +11,54 @@ CONFIG_SCHEMA = {
     "launch_command": str,
     "window_match": str,
     "open_steps": list,
-    "no_payload": bool
+    "no_payload": bool,
+    "paste_payload": bool,
+    "paste_key": str
 }
 
 # Define the schema for open steps
 OPEN_STEP_SCHEMA = {
     "action": str,
     "value": str  # The 'value' can be any type, but we'll store it as a string and convert when needed
-}
\ No newline at end of file
+}
+
+
+def coerce_config(config_data):
+    """
+    Convert configuration values to the types declared in CONFIG_SCHEMA.
+
+    Keys not present in the schema are passed through unchanged.
+
+    Args:
+        config_data (dict): The configuration values to convert.
+
+    Returns:
+        dict: A new dictionary with converted values.
+
+    Raises:
+        ValueError: If a value cannot be converted to its schema type.
+    """
+    converted = {}
+    try:
+        for key, value in config_data.items():
+            converter = CONFIG_SCHEMA.get(key)
+            converted[key] = converter(value) if converter else value
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid value for {key}. Expected {CONFIG_SCHEMA[key].__name__}.")
+    return converted
+
+
+def requires_window_id(app_config):
+    """
+    Check whether an application configuration needs an explicit window ID.
+
+    Only local configurations with a launch command find their own window;
+    every other configuration must be given a window with -w.
+
+    Args:
+        app_config (dict): The application configuration.
+
+    Returns:
+        bool: True if a window ID must be supplied, False otherwise.
+    """
+    return app_config.get("type") != "local" or "launch_command" not in app_config
@@ -1,11 +1,48 @@
+import io
+import mmap
+import os
 import tkinter as tk
 from tkinter import ttk
+from tkinter import font as tkfont
+
+# Number of characters inserted into the text widget per idle callback
+INSERT_CHUNK_SIZE = 64 * 1024
+
+# Files larger than this are memory-mapped and only the visible lines are rendered
+LARGE_FILE_THRESHOLD = 1_000_000
+
+# Longest line scanned when looking for line boundaries in a memory-mapped file
+MAX_LINE_BYTES = 4096
+
+def open_file_content(file_path):
+    """
+    Open a file for display in a ContentViewerWindow.
+
+    Args:
+        file_path (str): Path to the file.
+
+    Returns:
+        A memory map of the file if it is larger than LARGE_FILE_THRESHOLD,
+        otherwise an open text file.
+    """
+    if os.path.getsize(file_path) > LARGE_FILE_THRESHOLD:
+        with open(file_path, 'rb') as file:
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    return open(file_path, 'r', errors='replace')
 
 class ContentViewerWindow(tk.Toplevel):
     def __init__(self, parent, title, content):
         super().__init__(parent)
         self.title(title)
         self.geometry("400x400")
+        self._pump_id = None
+        self._source = None
+        self._mm = None
+        # Bound to the event rather than overriding destroy() so the cleanup also
+        # runs when the window is destroyed from Tcl, e.g. by the window manager
+        self.bind('<Destroy>', self._on_destroy)
+        # Let the close button go through destroy() so Tkinter also forgets the widget
+        self.protocol("WM_DELETE_WINDOW", self.destroy)
         self.create_widgets(content)
 
     def create_widgets(self, content):
@@ -17,19 +54,133 @@ class ContentViewerWindow(tk.Toplevel):
         self.text_widget = tk.Text(frame, wrap='word', font=('TkDefaultFont', 10))
         self.text_widget.pack(side='left', expand=True, fill='both')
 
-        scrollbar = ttk.Scrollbar(frame, orient='vertical', command=self.text_widget.yview)
-        scrollbar.pack(side='right', fill='y')
+        self.scrollbar = ttk.Scrollbar(frame, orient='vertical', command=self.text_widget.yview)
+        self.scrollbar.pack(side='right', fill='y')
 
-        self.text_widget.config(yscrollcommand=scrollbar.set)
+        self.text_widget.config(yscrollcommand=self.scrollbar.set)
 
-        # Insert the content into the text widget
-        self.text_widget.insert('1.0', content)
-        self.text_widget.config(state='disabled')  # Make it read-only
+        if isinstance(content, mmap.mmap):
+            self._setup_mapped_view(content)
+        else:
+            # Insert the content in chunks so the window appears immediately for large content.
+            # The content can be a string or an open text file, which is closed once fully read.
+            self._source = io.StringIO(content) if isinstance(content, str) else content
+            self._pump()
 
         # Create an OK button
         ok_button = ttk.Button(self, text="OK", command=self.destroy)
         ok_button.pack(pady=10)
 
+    def _pump(self):
+        """
+        Insert the next chunk of content and reschedule until the source is exhausted.
+        """
+        chunk = self._source.read(INSERT_CHUNK_SIZE)
+        if not chunk:
+            self._pump_id = None
+            self._source.close()
+            return
+        self.text_widget.config(state='normal')
+        self.text_widget.insert(tk.END, chunk)
+        self.text_widget.config(state='disabled')  # Make it read-only
+        self._pump_id = self.after_idle(self._pump)
+
+    def _setup_mapped_view(self, mm):
+        """
+        Display a memory-mapped file by rendering only the lines in the viewport.
+
+        The scrollbar tracks the byte offset in the file rather than the
+        contents of the text widget.
+        """
+        self._mm = mm
+        self._offset = 0
+        self._linespace = tkfont.Font(font=self.text_widget['font']).metrics('linespace')
+        self.text_widget.config(wrap='none', yscrollcommand='')
+        self.scrollbar.config(command=self._on_scroll)
+        self.text_widget.bind('<Configure>', lambda event: self._render())
+        self.text_widget.bind('<MouseWheel>', lambda event: self._scroll_lines(-3 if event.delta > 0 else 3))
+        self.text_widget.bind('<Button-4>', lambda event: self._scroll_lines(-3))
+        self.text_widget.bind('<Button-5>', lambda event: self._scroll_lines(3))
+        self._render()
+
+    def _visible_lines(self):
+        return max(1, self.text_widget.winfo_height() // self._linespace)
+
+    def _line_start(self, pos):
+        """
+        Return the offset of the start of the line containing pos.
+        """
+        start = max(0, pos - MAX_LINE_BYTES)
+        newline = self._mm.rfind(b'\n', start, pos)
+        return newline + 1 if newline != -1 else start
+
+    def _next_line(self, pos):
+        """
+        Return the offset of the start of the line after the one at pos.
+        """
+        newline = self._mm.find(b'\n', pos, pos + MAX_LINE_BYTES)
+        return newline + 1 if newline != -1 else min(len(self._mm), pos + MAX_LINE_BYTES)
+
+    def _render(self):
+        """
+        Render the lines of the mapped file that fit in the viewport, starting at the current offset.
+        """
+        size = len(self._mm)
+        self._offset = min(self._offset, self._line_start(size - 1))
+        end = self._offset
+        for _ in range(self._visible_lines()):
+            if end >= size:
+                break
+            end = self._next_line(end)
+
+        self.text_widget.config(state='normal')
+        self.text_widget.delete('1.0', tk.END)
+        self.text_widget.insert('1.0', self._mm[self._offset:end].decode('utf-8', errors='replace'))
+        self.text_widget.config(state='disabled')
+        self.scrollbar.set(self._offset / size, end / size)
+
+    def _scroll_lines(self, count):
+        if count > 0:
+            for _ in range(count):
+                self._offset = self._next_line(self._offset)
+        else:
+            for _ in range(-count):
+                if self._offset == 0:
+                    break
+                self._offset = self._line_start(self._offset - 1)
+        self._render()
+        return "break"
+
+    def _on_scroll(self, *args):
+        """
+        Handle scrollbar commands ('moveto' fraction or 'scroll' count units/pages) for the mapped view.
+        """
+        if args[0] == 'moveto':
+            # Dragging the thumb past either end gives fractions outside 0..1
+            fraction = min(max(float(args[1]), 0.0), 1.0)
+            self._offset = self._line_start(int(fraction * len(self._mm)))
+            self._render()
+        elif args[0] == 'scroll':
+            count = int(args[1])
+            if args[2] == 'pages':
+                count *= self._visible_lines()
+            self._scroll_lines(count)
+
+    def _on_destroy(self, event):
+        """
+        Stop filling the text widget and close the content source or memory map when the window is destroyed.
+        """
+        # The Toplevel's binding also fires for each of its child widgets
+        if event.widget is not self:
+            return
+        if self._pump_id:
+            self.after_cancel(self._pump_id)
+            self._pump_id = None
+            self._source.close()
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+
     def show(self):
         self.grab_set()  # Make the window modal
-        self.wait_window()  # Wait for the window to be closed
\ No newline at end of file
+        self.wait_window()  # Wait for the window to be closed
@@ -6,16 +6,60 @@ import json
 import os
 import logging
 import queue
+import re
+import signal
 import threading
+import time
 from edit_config_window import EditConfigWindow
 from tooltip import ToolTip
-from config_schema import CONFIG_SCHEMA
+from config_schema import coerce_config, requires_window_id
 import shlex
 import pyperclip
-from content_viewer_window import ContentViewerWindow
+from content_viewer_window import ContentViewerWindow, open_file_content
 
+try:
+    import orjson  # Optional: faster config.json parsing
+except ImportError:
+    orjson = None
 
 
+
+# How long an enumerated window list is reused before querying the window manager again
+WINDOW_CACHE_TTL = 2.0
+
+# Interval at which the Tk thread checks for the result of a background window enumeration
+WINDOW_POLL_MS = 50
+
+# Settings that fall back to the .env file when an application does not define them
+ENV_DEFAULT_KEYS = ("WINDOW_TITLE", "DELAY_BETWEEN_KEYS", "DELAY_BETWEEN_COMMANDS", "DELAY_BETWEEN_APPLICATIONS",
+                    "APP_LOAD_TIME", "CHUNK_SIZE", "DELAY_BETWEEN_CHUNKS")
+
+# Command-line flag passed to molly-macro.py for each configuration mode
+MODE_FLAGS = {
+    "text": "-t",
+    "spreadsheet": "-s",
+    "image": "-i",
+    "code": "-e"
+}
+
+# Delay in milliseconds used to coalesce bursts of command preview updates
+PREVIEW_DEBOUNCE_MS = 80
+
+# Maximum number of bytes read from a script output pipe at once
+OUTPUT_READ_SIZE = 65536
+
+# Interval for checking whether the script has exited once its output is closed
+EXIT_POLL_MS = 10
+
+# How long a stopped script gets to exit after SIGTERM before it is killed
+STOP_KILL_DELAY_MS = 2000
+
+# How long the completion message stays in the status bar before it returns to "Ready"
+COMPLETION_STATUS_MS = 3000
+
+# KEY=value lines in the .env file; the value may itself contain '='
+ENV_LINE_RE = re.compile(rb'^[ \t]*([A-Za-z_][A-Za-z0-9_]*)=([^\r\n]*)\r?$', re.MULTILINE)
+
 # Set up logging
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(filename)s:%(funcName)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -28,6 +72,12 @@ class DataTransferGUI:
     including running the molly-macro.py script and monitoring its progress.
     """
 
+    # Line prefixes emitted by molly-macro.py, matched against the raw output bytes
+    PROGRESS_PREFIX = b"PROGRESS:"
+    PROGRESS_PREFIX_LEN = len(PROGRESS_PREFIX)
+    ERROR_PREFIX = b"ERROR:"
+    ERROR_PREFIX_LEN = len(ERROR_PREFIX)
+
     def __init__(self, master):
         self.master = master
         self.root = master  # Store reference to the root window
@@ -36,12 +86,19 @@ class DataTransferGUI:
         master.resizable(False, False)
 
         self.process = None
-        self.progress_queue = queue.Queue()
-        self.should_update_progress = False
-        self.disabled_widgets = []  # List to keep track of disabled widgets
+        self._output_buffers = {}  # Partial line read from each script output pipe
+        self.disabled_widgets = []  # (widget, previous state) of widgets disabled by disable_main_window
 
         self.windows = []  # This will store tuples of (window_name, window_id)
         self.selected_window_id = None  # This will store the selected window ID
+        self._win_cache = (0.0, [])  # (monotonic timestamp, windows) of the last enumeration
+        self._window_queue = queue.Queue()  # Results handed from the enumeration thread to the Tk thread
+        self._window_thread = None
+        self._preview_after_id = None  # Pending debounced command preview update
+        self._last_argv = []  # Argument list shown in the command preview
+        self._prefix_config_name = None  # Configuration the cached command prefix was built for
+        self._prefix_cache = None
+        self._status_after_id = None  # Pending reset of the completion message in the status bar
 
         self.load_config()
         self._create_widgets()
@@ -55,12 +112,13 @@ class DataTransferGUI:
         """
         Load the configuration file and environment variables.
 
-        This method loads the configuration from a JSON file and the environment file,
-        updating the configuration with default values where necessary.
+        This method loads the configuration from a JSON file and the environment file.
+        Default values from the environment file are applied lazily by get_app_config.
         """
         try:
-            with open("config.json", "r") as file:
-                self.config = json.load(file)
+            with open("config.json", "rb") as file:
+                data = file.read()
+            self.config = orjson.loads(data) if orjson else json.loads(data)
             logger.info("Configuration loaded successfully")
         except Exception as e:
             logger.error(f"Failed to load configuration: {e}")
@@ -69,22 +127,37 @@ class DataTransferGUI:
         # Load environment variables
         self.env_config = {}
         try:
-            with open(".env", "r") as file:
-                for line in file:
-                    parts = line.strip().split('=')
-                    if len(parts) == 2:
-                        key, value = parts
-                        self.env_config[key] = value
+            with open(".env", "rb") as file:
+                data = file.read()
+            self.env_config = {key.decode(): value.decode().strip() for key, value in ENV_LINE_RE.findall(data)}
             logger.info("Environment variables loaded successfully")
         except Exception as e:
             logger.error(f"Failed to load environment variables: {e}")
 
-        # Apply default values from .env file if not present in the config
-        for app, app_config in self.config.get("applications", {}).items():
-            for key in ["WINDOW_TITLE", "DELAY_BETWEEN_KEYS", "DELAY_BETWEEN_COMMANDS", "DELAY_BETWEEN_APPLICATIONS",
-                        "APP_LOAD_TIME", "CHUNK_SIZE", "DELAY_BETWEEN_CHUNKS"]:
+        # Default values from the .env file are applied per application on first use
+        self._defaults_applied = set()
+
+    def get_app_config(self, config_name):
+        """
+        Return the configuration for an application, or None if it does not exist.
+
+        Default values from the .env file are filled in the first time an
+        application is looked up rather than for every application at startup,
+        so only the configurations that are actually used pay for it.
+
+        Args:
+            config_name (str): Name of the application configuration.
+
+        Returns:
+            dict: The application configuration, or None if not found.
+        """
+        app_config = self.config.get('applications', {}).get(config_name)
+        if app_config is not None and config_name not in self._defaults_applied:
+            for key in ENV_DEFAULT_KEYS:
                 if key not in app_config and key in self.env_config:
                     app_config[key] = self.env_config[key]
+            self._defaults_applied.add(config_name)
+        return app_config
 
     def _create_widgets(self):
         self._create_mode_selection()
@@ -107,6 +180,14 @@ class DataTransferGUI:
         self.view_content_button.pack(pady=10)
         ToolTip(self.view_content_button, "View the contents of the clipboard or selected file")
 
+        # Widgets that are disabled while a child window is open. Run and Stop are
+        # left out: their state follows the script, which may finish meanwhile.
+        self._stateful_widgets = [
+            self.config_dropdown, self.clipboard_check, self.file_entry, self.file_button,
+            self.window_entry, self.refresh_button, self.debug_check, self.command_preview,
+            self.edit_config_button, self.view_content_button
+        ]
+
         logger.debug("All widgets created")
 
     def _create_mode_selection(self):
@@ -150,7 +231,7 @@ class DataTransferGUI:
         self.window_label = ttk.Label(self.window_frame, text="Window:")
         self.window_label.pack(side=tk.LEFT)
 
-        self.window_entry = ttk.Combobox(self.window_frame, width=30)
+        self.window_entry = ttk.Combobox(self.window_frame, width=30, postcommand=self.on_window_dropdown)
         self.window_entry.pack(side=tk.LEFT)
         self.window_entry.bind("<<ComboboxSelected>>", self.on_window_selected)
         ToolTip(self.window_entry, "Select the window for data transfer")
@@ -218,7 +299,10 @@ class DataTransferGUI:
         """
         self.command_label = ttk.Label(self.master, text="Command Preview:")
         self.command_label.pack(pady=5)
-        self.command_preview = ttk.Entry(self.master, width=50, state="readonly")
+        # A readonly entry shows the text of its variable, so updates need no state toggling
+        self.command_preview_var = tk.StringVar()
+        self.command_preview = ttk.Entry(self.master, width=50, state="readonly",
+                                         textvariable=self.command_preview_var)
         self.command_preview.pack(pady=5)
         ToolTip(self.command_preview, "Preview of the command that will be executed")
 
@@ -255,11 +339,10 @@ class DataTransferGUI:
         """
         Bind events to update the command preview.
         """
-        self.selected_config.trace("w", self.update_command_preview)
-        self.file_entry.bind("<KeyRelease>", self.update_command_preview)
-        self.window_entry.bind("<KeyRelease>", self.update_command_preview)
-        self.clipboard_var.trace("w", self.update_command_preview)
-        self.debug_var.trace("w", self.update_command_preview)
+        for variable in (self.selected_config, self.clipboard_var, self.debug_var):
+            variable.trace_add("write", self.update_command_preview)
+        for entry in (self.file_entry, self.window_entry):
+            entry.bind("<KeyRelease>", self.update_command_preview)
 
         logger.debug("Events bound to command preview update")
 
@@ -271,7 +354,7 @@ class DataTransferGUI:
         self.file_entry.delete(0, tk.END)
         self.file_entry.insert(0, filename)
         self.update_command_preview()
-        logger.debug(f"Selected file: {filename}")
+        logger.debug("Selected file: %s", filename)
 
     def on_window_selected(self, event):
         selected_name = self.window_entry.get()
@@ -280,119 +363,94 @@ class DataTransferGUI:
             if name == selected_name:
                 self.selected_window_id = win_id
                 break
-        logger.debug(f"Selected window: {selected_name}, ID: {self.selected_window_id}")
+        logger.debug("Selected window: %s, ID: %s", selected_name, self.selected_window_id)
         self.update_command_preview()
 
     def update_command_preview(self, *args):
+        """
+        Schedule a command preview update.
+
+        Keystrokes and variable traces arrive in bursts, so the rebuild is
+        debounced and only runs once input pauses for PREVIEW_DEBOUNCE_MS.
+        """
+        if self._preview_after_id:
+            self.master.after_cancel(self._preview_after_id)
+        self._preview_after_id = self.master.after(PREVIEW_DEBOUNCE_MS, self._do_update_command_preview)
+
+    def flush_command_preview(self):
+        """
+        Run any pending debounced command preview update immediately.
+        """
+        if self._preview_after_id:
+            self.master.after_cancel(self._preview_after_id)
+            self._do_update_command_preview()
+
+    def _do_update_command_preview(self):
+        self._preview_after_id = None
         config_name = self.selected_config.get()
         if not config_name:
             return
 
-        command = [sys.executable, "molly-macro.py", "--config_name", shlex.quote(config_name), "--config",
-                   "config.json"]
-
-        app_config = self.config['applications'].get(config_name, {})
-        mode = app_config.get('mode')
-        if mode:
-            mode_flags = {
-                "text": "-t",
-                "spreadsheet": "-s",
-                "image": "-i",
-                "code": "-e"
-            }
-            if mode in mode_flags:
-                command.append(mode_flags[mode])
-            else:
-                logger.warning(f"Unknown mode '{mode}' in configuration")
+        prefix, needs_window_id = self._command_prefix(config_name)
+        command = list(prefix)
 
-            # Add window ID for non-local configurations or those without a launch command
-        if app_config.get("type") != "local" or "launch_command" not in app_config:
+        # Add window ID for non-local configurations or those without a launch command
+        if needs_window_id:
             if self.selected_window_id:
                 command.extend(["-w", self.selected_window_id])
             else:
                 logger.warning("No window ID selected for non-local configuration")
 
-        if self.clipboard_var.get():
+        use_clipboard = self.clipboard_var.get()
+        if use_clipboard:
             command.append("-c")
 
         if self.debug_var.get():
             command.append("-d")
 
-        file_path = self.file_entry.get()
-        if file_path and not self.clipboard_var.get():
-            command.append(shlex.quote(file_path))
-
-        command_str = " ".join(command)
-        self.command_preview.config(state="normal")
-        self.command_preview.delete(0, tk.END)
-        self.command_preview.insert(0, command_str)
-        self.command_preview.config(state="readonly")
-        logger.debug(f"Updated command preview: {command_str}")
-        logger.debug(f"Current selected window ID: {self.selected_window_id}")
-
-    def run_script(self):
-        config_name = self.selected_config.get()
-        if not config_name:
-            messagebox.showerror("Error", "Please select a configuration.")
-            return
+        if not use_clipboard:
+            file_path = self.file_entry.get()
+            if file_path:
+                command.append(file_path)
 
-        app_config = self.config['applications'].get(config_name)
-        if not app_config:
-            messagebox.showerror("Error", "Selected configuration not found.")
+        # Nothing to redraw if the command is the same as the one already shown
+        if command == self._last_argv:
             return
 
-        command = shlex.split(self.command_preview.get())
-
-        # Check if we need to add the window ID
-        if app_config["type"] != "local" or "launch_command" not in app_config:
-            if not self.selected_window_id:
-                messagebox.showerror("Error", "No window selected.")
-                return
-            # Remove existing -w argument if present
-            if "-w" in command:
-                w_index = command.index("-w")
-                del command[w_index:w_index + 2]
-            # Add the correct window ID
-            command.extend(["-w", self.selected_window_id])
-
-        self.run_button.config(state=tk.DISABLED)
-        self.stop_button.config(state=tk.NORMAL)
-        self.status_bar.config(text="Running...")
-        self.progress_bar['value'] = 0
-        self.progress_label['text'] = "0%"
+        # Keep the argument list for run_script; the quoted string is for display only
+        self._last_argv = command
+        command_str = shlex.join(command)
+        self.command_preview_var.set(command_str)
+        logger.debug("Updated command preview: %s", command_str)
+        logger.debug("Current selected window ID: %s", self.selected_window_id)
 
-        logger.info(f"Starting script execution: {' '.join(command)}")
+    def _command_prefix(self, config_name):
+        """
+        Return the configuration-dependent start of the command and whether it needs a window ID.
 
-        self.should_update_progress = True
-        self.update_progress()  # Start progress updates
+        The result only depends on the selected configuration, so it is cached
+        until a different configuration is selected or the configuration is saved.
 
-        def run_process():
-            try:
-                self.process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-                                                universal_newlines=True, bufsize=1)
+        Args:
+            config_name (str): Name of the selected configuration.
 
-                stdout_thread = threading.Thread(target=self.handle_output, args=(self.process.stdout,))
-                stderr_thread = threading.Thread(target=self.handle_output, args=(self.process.stderr,))
-                stdout_thread.start()
-                stderr_thread.start()
-
-                self.process.wait()
-                stdout_thread.join()
-                stderr_thread.join()
+        Returns:
+            tuple: (list of command arguments, bool whether -w must be added)
+        """
+        if config_name != self._prefix_config_name:
+            command = [sys.executable, "molly-macro.py", "--config_name", config_name, "--config", "config.json"]
 
-                if self.process.returncode != 0:
-                    self.master.after(0, lambda: self.show_error_popup(
-                        f"Script exited with non-zero status: {self.process.returncode}"))
+            app_config = self.get_app_config(config_name) or {}
+            mode = app_config.get('mode')
+            if mode:
+                if mode in MODE_FLAGS:
+                    command.append(MODE_FLAGS[mode])
                 else:
-                    self.master.after(0, self.script_finished)
-            except Exception as e:
-                logger.error(f"Script execution failed: {e}")
-                self.master.after(0, lambda: self.show_error_popup(str(e)))
-            finally:
-                self.should_update_progress = False
+                    logger.warning(f"Unknown mode '{mode}' in configuration")
 
-        thread = threading.Thread(target=run_process)
-        thread.start()
+            self._prefix_cache = (command, requires_window_id(app_config))
+            self._prefix_config_name = config_name
+        return self._prefix_cache
 
     def view_content(self):
         if self.clipboard_var.get():
@@ -404,8 +462,8 @@ class DataTransferGUI:
                 messagebox.showerror("Error", "No file selected.")
                 return
             try:
-                with open(file_path, 'r') as file:
-                    content = file.read()
+                # The viewer reads the file incrementally (or memory-maps it if large) and closes it
+                content = open_file_content(file_path)
                 title = f"File Content: {file_path}"
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to read file: {str(e)}")
@@ -427,24 +485,131 @@ class DataTransferGUI:
         logger.info("Configurations list refreshed")
 
     def refresh_windows(self):
+        """
+        Refresh the list of open windows.
+
+        The window enumeration runs on a background thread so the GUI does not
+        stall while the external tools are queried. Tk may only be used from its
+        own thread, so the thread puts the result on a queue that the Tk thread
+        polls every WINDOW_POLL_MS. A list enumerated less than WINDOW_CACHE_TTL
+        seconds ago is reused instead of querying the window manager again.
+        """
+        timestamp, windows = self._win_cache
+        if time.monotonic() - timestamp < WINDOW_CACHE_TTL:
+            logger.debug("Reusing cached window list")
+            self._apply_windows(windows)
+            return
+        if self._window_thread and self._window_thread.is_alive():
+            return  # The enumeration already running will update the list
+        self._window_thread = threading.Thread(target=self._enumerate_windows, daemon=True)
+        self._window_thread.start()
+        self.master.after(WINDOW_POLL_MS, self._poll_windows)
+
+    def _enumerate_windows(self):
+        """
+        List the open windows with a single wmctrl call, falling back to xdotool.
+
+        Runs on the enumeration thread; the list, or None on failure, is put on
+        the window queue.
+        """
+        windows = None
         try:
-            output = subprocess.check_output(["xdotool", "search", "--onlyvisible", "--name", "."]).decode("utf-8")
-            window_ids = output.strip().split('\n')
-            self.windows = []
-            for win_id in window_ids:
-                if win_id:
-                    try:
-                        name = subprocess.check_output(["xdotool", "getwindowname", win_id]).decode("utf-8").strip()
-                        self.windows.append((name, win_id))
-                    except subprocess.CalledProcessError:
-                        pass  # Skip windows that can't be queried
-
-            window_names = [name for name, _ in self.windows]
-            self.window_entry['values'] = window_names
-            logger.info(f"Windows list refreshed. Found {len(self.windows)} windows.")
-            logger.debug(f"Windows: {self.windows}")
-        except subprocess.CalledProcessError as e:
+            try:
+                windows = self._list_windows_wmctrl()
+            except FileNotFoundError:
+                logger.debug("wmctrl not available, falling back to xdotool")
+                windows = self._list_windows_xdotool()
+            self._win_cache = (time.monotonic(), windows)
+        except (subprocess.CalledProcessError, FileNotFoundError) as e:
             logger.error(f"Failed to refresh windows: {e}")
+        finally:
+            self._window_queue.put(windows)
+
+    def _poll_windows(self):
+        """
+        Apply the result of the background window enumeration once it is available.
+        """
+        try:
+            windows = self._window_queue.get_nowait()
+        except queue.Empty:
+            self.master.after(WINDOW_POLL_MS, self._poll_windows)
+            return
+        if windows is not None:
+            self._apply_windows(windows)
+
+    @staticmethod
+    def _list_windows_wmctrl():
+        """
+        Return (window_name, window_id) tuples from one `wmctrl -l` call.
+
+        wmctrl reports hexadecimal IDs; they are converted to the decimal form
+        used by xdotool. wmctrl also lists unmapped windows, so the result is
+        limited to the windows `xdotool search --onlyvisible` reports.
+        """
+        output = subprocess.run(["wmctrl", "-l"], check=True, capture_output=True, text=True).stdout
+        visible = set(subprocess.check_output(["xdotool", "search", "--onlyvisible", "--name", "."]).split())
+        windows = []
+        for line in output.splitlines():
+            parts = line.split(None, 3)
+            if len(parts) == 4:
+                win_id = str(int(parts[0], 16))
+                if win_id.encode() in visible:
+                    windows.append((parts[3], win_id))
+        return windows
+
+    @staticmethod
+    def _list_windows_xdotool():
+        """
+        Return (window_name, window_id) tuples using xdotool.
+
+        All window names are fetched with one xdotool invocation by chaining a
+        getwindowname command per window ID.
+        """
+        output = subprocess.check_output(["xdotool", "search", "--onlyvisible", "--name", "."]).decode("utf-8")
+        window_ids = output.split()
+        if not window_ids:
+            return []
+
+        command = ["xdotool"]
+        for win_id in window_ids:
+            command.extend(["getwindowname", win_id])
+        # A window that can't be queried stops the chain; keep the names printed before it
+        result = subprocess.run(command, check=False, capture_output=True)
+        names = result.stdout.decode("utf-8", errors="replace").split("\n")
+        return [(name, win_id) for name, win_id in zip(names, window_ids) if name]
+
+    def _apply_windows(self, windows):
+        """
+        Store the enumerated windows and update the window dropdown.
+        """
+        self.windows = windows
+        window_names = [name for name, _ in self.windows]
+        self.window_entry['values'] = window_names
+
+        # An open dropdown lists a copy of the values made when it was opened
+        popdown = f"{self.window_entry}.popdown"
+        if self.window_entry.tk.call("winfo", "exists", popdown) and \
+                self.window_entry.tk.call("winfo", "ismapped", popdown):
+            self.window_entry.tk.call("ttk::combobox::ConfigureListbox", self.window_entry)
+
+        logger.info(f"Windows list refreshed. Found {len(self.windows)} windows.")
+        logger.debug("Windows: %s", self.windows)
+
+    def invalidate_window_cache(self, event=None):
+        """
+        Discard the cached window list so the next refresh re-enumerates windows.
+        """
+        self._win_cache = (0.0, [])
+
+    def on_window_dropdown(self):
+        """
+        Re-enumerate the open windows when the window dropdown is opened.
+
+        The enumeration finishes in the background; _apply_windows updates the
+        list shown in the dropdown if it is still open by then.
+        """
+        self.invalidate_window_cache()
+        self.refresh_windows()
 
     def run_script(self):
         config_name = self.selected_config.get()
@@ -452,15 +617,16 @@ class DataTransferGUI:
             messagebox.showerror("Error", "Please select a configuration.")
             return
 
-        app_config = self.config['applications'].get(config_name)
+        app_config = self.get_app_config(config_name)
         if not app_config:
             messagebox.showerror("Error", "Selected configuration not found.")
             return
 
-        command = shlex.split(self.command_preview.get())
+        self.flush_command_preview()
+        command = list(self._last_argv)
 
         # Check if we need to add the window ID
-        if app_config["type"] != "local" or "launch_command" not in app_config:
+        if requires_window_id(app_config):
             if not self.selected_window_id:
                 messagebox.showerror("Error", "No window selected.")
                 return
@@ -471,6 +637,7 @@ class DataTransferGUI:
             # Add the correct window ID
             command.extend(["-w", self.selected_window_id])
 
+        self._cancel_status_reset()
         self.run_button.config(state=tk.DISABLED)
         self.stop_button.config(state=tk.NORMAL)
         self.status_bar.config(text="Running...")
@@ -479,58 +646,110 @@ class DataTransferGUI:
 
         logger.info(f"Starting script execution: {' '.join(command)}")
 
-        self.should_update_progress = True
-        self.update_progress()  # Start progress updates
+        self.transfer_completed = False
+        self._pending_progress = None  # Latest progress value not yet shown
 
-        def run_process():
-            try:
-                self.process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-                                                universal_newlines=True, bufsize=1)
+        try:
+            # Its own session makes the script the leader of a process group that
+            # stop_script can signal as a whole, helpers included
+            self.process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                            start_new_session=True)
+        except Exception as e:
+            logger.error(f"Script execution failed: {e}")
+            self.show_error_popup(str(e))
+            return
 
-                stdout_thread = threading.Thread(target=self.handle_output, args=(self.process.stdout,))
-                stderr_thread = threading.Thread(target=self.handle_output, args=(self.process.stderr,))
-                stdout_thread.start()
-                stderr_thread.start()
+        self.watch_output(self.process.stdout, self.process.stderr)
 
-                # Wait for the process to complete
-                self.process.wait()
+    def watch_output(self, *pipes):
+        """
+        Read the given pipes from Tk's event loop as they become readable.
 
-                # Wait for stdout and stderr to be fully processed
-                stdout_thread.join()
-                stderr_thread.join()
+        Tk watches the file descriptors itself, so no reader thread or polling
+        is needed. Once every pipe has reached EOF the script is reaped and the
+        result reported.
+        """
+        self._output_buffers = {}
+        for pipe in pipes:
+            self._output_buffers[pipe] = b""
+            self.master.tk.createfilehandler(pipe, tk.READABLE, self._read_output)
 
-                # Check if the transfer was completed
-                if self.transfer_completed:
-                    self.master.after(0, self.script_finished)
-                else:
-                    self.master.after(0, lambda: self.show_error_popup("Transfer did not complete successfully"))
+    def _read_output(self, pipe, mask):
+        """
+        Read what is available on one script output pipe and dispatch complete lines.
+        """
+        chunk = os.read(pipe.fileno(), OUTPUT_READ_SIZE)
+        if chunk:
+            *lines, self._output_buffers[pipe] = (self._output_buffers[pipe] + chunk).split(b"\n")
+            for line in lines:
+                self._dispatch_line(line)
+            return
 
-            except Exception as e:
-                logger.error(f"Script execution failed: {e}")
-                self.master.after(0, lambda: self.show_error_popup(str(e)))
-            finally:
-                self.should_update_progress = False
+        self.master.tk.deletefilehandler(pipe)
+        pipe.close()
+        remainder = self._output_buffers.pop(pipe)
+        if remainder:
+            self._dispatch_line(remainder)
+        if not self._output_buffers:
+            self._output_finished(self.process)
 
-        thread = threading.Thread(target=run_process)
-        thread.start()
+    def unwatch_output(self):
+        """
+        Stop reading the pipes registered by watch_output and close them.
+        """
+        for pipe in self._output_buffers:
+            self.master.tk.deletefilehandler(pipe)
+            pipe.close()
+        self._output_buffers = {}
 
-    def handle_output(self, pipe):
-        self.transfer_completed = False
-        for line in iter(pipe.readline, ''):
-            line = line.strip()
-            if line.startswith("PROGRESS:"):
-                try:
-                    progress = float(line.split(":")[1])
-                    self.progress_queue.put(progress)
-                    if progress >= 100:
-                        self.transfer_completed = True
-                        logger.info("Transfer completed")
-                except ValueError:
-                    logger.error(f"Invalid progress value: {line}")
-            elif line.startswith("ERROR:"):
-                self.master.after(0, lambda: self.show_error_popup(line[6:]))
-            else:
-                logger.debug(f"Script output: {line}")
+    def _output_finished(self, process):
+        """
+        Reap the script once its output is closed and report whether the transfer completed.
+
+        The script normally exits together with closing its output; if it has
+        not yet, it is polled again shortly rather than blocking Tk in wait().
+        """
+        if process is not self.process:
+            return  # The script was stopped meanwhile
+        if process.poll() is None:
+            self.master.after(EXIT_POLL_MS, self._output_finished, process)
+            return
+
+        # Show the final progress before the GUI is reset
+        self._apply_pending_progress()
+
+        # A failed transfer can still have printed PROGRESS:100 before failing
+        if self.transfer_completed and process.returncode == 0:
+            self.script_finished()
+        else:
+            self.show_error_popup("Transfer did not complete successfully")
+
+    def _dispatch_line(self, line):
+        """
+        Handle one line of script output: progress updates, errors, or log output.
+
+        The line is given as bytes and only decoded when its text is needed.
+        """
+        line = line.strip()
+        if line[:self.PROGRESS_PREFIX_LEN] == self.PROGRESS_PREFIX:
+            try:
+                progress = float(line[self.PROGRESS_PREFIX_LEN:])
+                # molly-macro.py already limits how often it reports progress, so every
+                # value is taken. One update is scheduled and shows whatever value is
+                # pending when Tk becomes idle.
+                if self._pending_progress is None:
+                    self.master.after_idle(self._apply_pending_progress)
+                self._pending_progress = progress
+                if progress >= 100:
+                    self.transfer_completed = True
+                    logger.info("Transfer completed")
+            except ValueError:
+                logger.error("Invalid progress value: %r", line)
+        elif line[:self.ERROR_PREFIX_LEN] == self.ERROR_PREFIX:
+            message = line[self.ERROR_PREFIX_LEN:].decode("utf-8", errors="replace")
+            self.master.after(0, lambda: self.show_error_popup(message))
+        elif logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Script output: %s", line.decode("utf-8", errors="replace"))
 
     def show_error_popup(self, error_message):
         """
@@ -540,34 +759,70 @@ class DataTransferGUI:
         self.reset_gui_state()
         logger.error(f"Script execution failed: {error_message}")
 
-    def update_progress(self):
+    def _apply_pending_progress(self):
         """
-        Update the progress bar, percentage label, and status bar.
+        Show the most recent progress value received since the last update.
         """
-        try:
-            while not self.progress_queue.empty():
-                progress = self.progress_queue.get_nowait()
-                self.progress_bar['value'] = progress
-                self.progress_label['text'] = f"{progress:.1f}%"
-                self.status_bar.config(text=f"Running... {progress:.1f}% complete")
-                logger.debug(f"Updated progress bar: {progress:.1f}%")
-        except queue.Empty:
-            pass
+        progress, self._pending_progress = self._pending_progress, None
+        if progress is not None:
+            self.update_progress(progress)
+
+    def update_progress(self, progress):
+        """
+        Update the progress bar, percentage label, and status bar.
 
-        if self.should_update_progress:
-            self.master.after(100, self.update_progress)
+        Called through _apply_pending_progress, so a burst of progress lines
+        costs a single redraw.
+        """
+        self.progress_bar['value'] = progress
+        self.progress_label['text'] = f"{progress:.1f}%"
+        self.status_bar.config(text=f"Running... {progress:.1f}% complete")
+        logger.debug("Updated progress bar: %.1f%%", progress)
 
     def stop_script(self):
         """
-        Terminate the running script process.
+        Terminate the running script process and any helpers it started.
+
+        The script's output is no longer read once it is stopped, so a new run
+        can start straight away. Helpers such as dotool are in the script's
+        process group and are stopped with it. Anything still running after
+        STOP_KILL_DELAY_MS is killed.
         """
         if self.process:
-            self.process.terminate()
+            process, self.process = self.process, None
+            self.unwatch_output()
+            self._pending_progress = None
+            self._signal_script(process, signal.SIGTERM)
+            self.master.after(STOP_KILL_DELAY_MS, self._kill_script, process)
             logger.info("Script execution terminated by user")
             self.status_bar.config(text="Stopped")
             self.run_button.config(state=tk.NORMAL)
             self.stop_button.config(state=tk.DISABLED)
-            self.should_update_progress = False
+
+    def _signal_script(self, process, sig):
+        """
+        Send a signal to a script's process group.
+
+        Returns:
+            bool: True if any process in the group was signalled.
+        """
+        try:
+            os.killpg(process.pid, sig)
+            return True
+        except ProcessLookupError:
+            return False  # The script and its helpers have already exited
+
+    def _kill_script(self, process):
+        """
+        Kill whatever is left of a stopped script's process group and reap the script.
+
+        Until the script is reaped here its pid, and so its process group ID,
+        cannot be reused by an unrelated process.
+        """
+        process.poll()  # Reap the script if SIGTERM ended it, so only live processes are counted
+        if self._signal_script(process, signal.SIGKILL):
+            logger.warning("Killed script processes that did not exit after being stopped")
+        process.wait()
 
     def script_finished(self):
         """
@@ -575,24 +830,44 @@ class DataTransferGUI:
         """
         logger.info("Script execution completed successfully")
         self.status_bar.config(text="Completed")
-        self.should_update_progress = False
 
-        # Display completion popup
-        self.master.after(0, self.show_completion_popup)
+        if hasattr(self, 'warnings') and self.warnings:
+            # Warnings need the user's attention, so they still get a popup
+            self.master.after(0, self.show_completion_popup)
+            return
+
+        # A plain success is shown in the status bar without a modal dialog,
+        # so the GUI is ready for the next run straight away
+        self.reset_gui_state()
+        self.status_bar.config(text="Transfer completed successfully", foreground="green")
+        self._status_after_id = self.master.after(COMPLETION_STATUS_MS, self._reset_status)
 
     def show_completion_popup(self):
         """
-        Display a popup indicating the transfer is complete and reset the GUI state after user acknowledgment.
+        Display the transfer warnings in a popup and reset the GUI state after user acknowledgment.
         """
-        if hasattr(self, 'warnings') and self.warnings:
-            warning_message = "Transfer completed with warnings:\n\n" + "\n".join(self.warnings)
-            messagebox.showwarning("Transfer Complete", warning_message)
-        else:
-            messagebox.showinfo("Transfer Complete", "Transfer completed successfully.")
+        warning_message = "Transfer completed with warnings:\n\n" + "\n".join(self.warnings)
+        messagebox.showwarning("Transfer Complete", warning_message)
 
         # Reset GUI state after user closes the popup
         self.reset_gui_state()
 
+    def _reset_status(self):
+        """
+        Return the status bar to "Ready" after the completion message has been shown.
+        """
+        self._status_after_id = None
+        self.status_bar.config(text="Ready", foreground="")
+
+    def _cancel_status_reset(self):
+        """
+        Cancel a pending status bar reset and restore the default status bar colour.
+        """
+        if self._status_after_id:
+            self.master.after_cancel(self._status_after_id)
+            self._status_after_id = None
+            self.status_bar.config(foreground="")
+
     def reset_gui_state(self):
         """
         Reset the GUI state after transfer completion.
@@ -614,38 +889,25 @@ class DataTransferGUI:
         self.stop_button.config(state=tk.DISABLED)
         self.progress_bar['value'] = 0
         self.progress_label['text'] = "0%"
-        self.should_update_progress = False
 
     def disable_main_window(self):
         """
-        Disable all widgets in the main window that support the 'state' option.
+        Disable the interactive widgets in the main window, remembering their current state.
         """
-        for child in self.master.winfo_children():
-            if child.winfo_class() != 'Toplevel':  # Don't disable child windows
-                try:
-                    current_state = child.cget('state')
-                    if current_state != 'disabled':
-                        child.configure(state='disabled')
-                        self.disabled_widgets.append(child)
-                except tk.TclError:
-                    # This widget doesn't support the 'state' option, skip it
-                    pass
+        for widget in self._stateful_widgets:
+            current_state = str(widget.cget('state'))
+            if current_state != 'disabled':
+                widget.configure(state='disabled')
+                self.disabled_widgets.append((widget, current_state))
 
         logger.debug("Main window widgets disabled")
 
     def enable_main_window(self):
         """
-        Enable all previously disabled widgets in the main window.
+        Restore the widgets disabled by disable_main_window to their previous state.
         """
-        for widget in self.disabled_widgets:
-            try:
-                if isinstance(widget, ttk.Combobox):
-                    widget.configure(state='readonly')
-                else:
-                    widget.configure(state='normal')
-            except tk.TclError:
-                # This widget doesn't support the 'state' option, skip it
-                pass
+        for widget, previous_state in self.disabled_widgets:
+            widget.configure(state=previous_state)
         self.disabled_widgets.clear()
 
         # Instead of using wm_attributes, we'll just focus on the main window
@@ -663,27 +925,24 @@ class DataTransferGUI:
             messagebox.showerror("Error", "Please select a configuration to edit.")
             return
 
-        config_data = self.config['applications'][config_name]
+        config_data = self.get_app_config(config_name)
         self.disable_main_window()
         EditConfigWindow(self.master, self, config_name, config_data, self.save_config)
 
     def save_config(self, config_name, config_data):
         # Validate and convert the config data
-        validated_config = {}
-        for key, value in config_data.items():
-            if key in CONFIG_SCHEMA:
-                try:
-                    validated_config[key] = CONFIG_SCHEMA[key](value)
-                except ValueError:
-                    messagebox.showerror("Error", f"Invalid value for {key}. Expected {CONFIG_SCHEMA[key].__name__}.")
-                    return
-            else:
-                validated_config[key] = value
+        try:
+            validated_config = coerce_config(config_data)
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
 
         # Update the configuration in memory
         self.config['applications'][config_name] = validated_config
+        self._prefix_config_name = None  # The cached command prefix may be stale
 
-        # Save the updated configuration to the file
+        # Save the updated configuration to the file. Always written with json so
+        # the file's formatting does not depend on whether orjson is installed.
         with open("config.json", "w") as file:
             json.dump(self.config, file, indent=4)
 
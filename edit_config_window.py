@@ -28,6 +28,9 @@ class EditConfigWindow(tk.Toplevel):
 
     def _create_widgets(self):
         self.fields = {}
+        # Converter and type name per field, looked up from CONFIG_SCHEMA once
+        self._converters = {}
+        self._type_names = {}
 
         for idx, (key, value) in enumerate(self.config_data.items()):
             if key == "open_steps":
@@ -36,7 +39,11 @@ class EditConfigWindow(tk.Toplevel):
             label = ttk.Label(self, text=key)
             label.grid(row=idx, column=0, sticky=tk.W, padx=10, pady=5)
 
-            if CONFIG_SCHEMA[key] == bool:
+            converter = CONFIG_SCHEMA[key]
+            self._converters[key] = converter
+            self._type_names[key] = converter.__name__
+
+            if converter == bool:
                 var = tk.BooleanVar(value=value)
                 entry = ttk.Checkbutton(self, variable=var)
             else:
@@ -71,15 +78,16 @@ class EditConfigWindow(tk.Toplevel):
 
     def _convert_value(self, key, value):
         try:
-            return CONFIG_SCHEMA[key](value.get())
+            return self._converters[key](value.get())
         except ValueError:
-            messagebox.showerror("Error", f"Invalid value for {key}. Expected {CONFIG_SCHEMA[key].__name__}.")
+            messagebox.showerror("Error", f"Invalid value for {key}. Expected {self._type_names[key]}.")
             return None
 
     def save(self):
         new_config = {}
+        convert_value = self._convert_value
         for key, var in self.fields.items():
-            converted_value = self._convert_value(key, var)
+            converted_value = convert_value(key, var)
             if converted_value is None:
                 return
             new_config[key] = converted_value
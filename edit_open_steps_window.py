@@ -1,3 +1,4 @@
+import bisect
 import tkinter as tk
 from tkinter import ttk
 from config_schema import OPEN_STEP_SCHEMA
@@ -25,6 +26,13 @@ SPECIAL_KEYS = [
     "Home", "End", "Page_Up", "Page_Down", "Up", "Down", "Left", "Right"
 ]
 
+# Number of step rows created per idle callback when the window opens
+ROW_BATCH_SIZE = 10
+
+# SPECIAL_KEYS sorted for completion, with lowercase copies for matching; shared by all comboboxes
+SPECIAL_KEYS_SORTED = tuple(sorted(SPECIAL_KEYS, key=str.lower))
+SPECIAL_KEYS_SORTED_LOWER = tuple(key.lower() for key in SPECIAL_KEYS_SORTED)
+
 class AutocompleteCombobox(ttk.Combobox):
     def __init__(self, master=None, **kwargs):
         super().__init__(master, **kwargs)
@@ -33,17 +41,25 @@ class AutocompleteCombobox(ttk.Combobox):
         self.bind('<KeyRelease>', self.handle_keyrelease)
 
     def set_completion_list(self, completion_list):
-        self._completion_list = sorted(completion_list, key=str.lower)
+        if completion_list is SPECIAL_KEYS:
+            self._completion_list = SPECIAL_KEYS_SORTED
+            self._completion_list_lower = SPECIAL_KEYS_SORTED_LOWER
+        else:
+            self._completion_list = tuple(sorted(completion_list, key=str.lower))
+            self._completion_list_lower = tuple(item.lower() for item in self._completion_list)
         self._hits = []
         self._hit_index = 0
         self.position = 0
+        # Prefix of the previous search and the [start, end) range of its matches
+        self._prev_prefix = None
+        self._hit_range = (0, 0)
 
     def autocomplete(self, delta=0):
         if delta:
             self.delete(self.position, tk.END)
         else:
             self.position = len(self.get())
-        _hits = [item for item in self._completion_list if item.lower().startswith(self.get().lower())]
+        _hits = self._find_hits(self.get().lower())
         if _hits != self._hits:
             self._hit_index = 0
             self._hits = _hits
@@ -54,6 +70,27 @@ class AutocompleteCombobox(ttk.Combobox):
             self.insert(0, self._hits[self._hit_index])
             self.select_range(self.position, tk.END)
 
+    def _find_hits(self, prefix):
+        """
+        Return the completions starting with prefix.
+
+        The completion list is sorted, so the matches form a contiguous range
+        located with bisect. When the prefix extends the previous one, only the
+        previous range is searched.
+        """
+        lower_list = self._completion_list_lower
+        if self._prev_prefix is not None and prefix.startswith(self._prev_prefix):
+            lo, hi = self._hit_range
+        else:
+            lo, hi = 0, len(lower_list)
+        start = bisect.bisect_left(lower_list, prefix, lo, hi)
+        end = start
+        while end < hi and lower_list[end].startswith(prefix):
+            end += 1
+        self._prev_prefix = prefix
+        self._hit_range = (start, end)
+        return list(self._completion_list[start:end])
+
     def handle_keyrelease(self, event):
         if event.keysym == "BackSpace":
             self.delete(self.index(tk.INSERT), tk.END)
@@ -81,6 +118,11 @@ class EditOpenStepsWindow(tk.Toplevel):
         self.geometry("600x500")
         self.resizable(False, False)
         self.entries = []
+        # Converters for each open step field, looked up from OPEN_STEP_SCHEMA once
+        self._action_conv = OPEN_STEP_SCHEMA["action"]
+        self._value_conv = OPEN_STEP_SCHEMA["value"]
+        self._pending_steps = iter(())  # Steps whose rows have not been created yet
+        self._pending_id = None
 
         self._create_widgets()
 
@@ -89,15 +131,28 @@ class EditOpenStepsWindow(tk.Toplevel):
         self.grab_set()
 
     def _create_widgets(self):
-        self.step_frame = ttk.Frame(self)
-        self.step_frame.pack(padx=10, pady=10, fill=tk.BOTH, expand=True)
+        # The step rows live in a frame inside a scrollable canvas
+        self.canvas_frame = ttk.Frame(self)
+        self.canvas_frame.pack(padx=10, pady=10, fill=tk.BOTH, expand=True)
+
+        self.canvas = tk.Canvas(self.canvas_frame, highlightthickness=0)
+        scrollbar = ttk.Scrollbar(self.canvas_frame, orient=tk.VERTICAL, command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self.step_frame = ttk.Frame(self.canvas)
+        self.canvas.create_window((0, 0), window=self.step_frame, anchor=tk.NW)
+        self.step_frame.bind("<Configure>",
+                             lambda event: self.canvas.configure(scrollregion=self.canvas.bbox(tk.ALL)))
 
         # Create headers
         ttk.Label(self.step_frame, text="Action").grid(row=0, column=0, padx=5, pady=5)
         ttk.Label(self.step_frame, text="Value").grid(row=0, column=1, padx=5, pady=5)
 
-        for step in self.open_steps:
-            self.add_step_widgets(step)
+        # Create the rows in batches so the window opens without waiting for every row
+        self._pending_steps = iter(list(self.open_steps))
+        self._create_pending_rows()
 
         self.add_button = ttk.Button(self, text="Add Step", command=self.add_step)
         self.add_button.pack(pady=10)
@@ -119,38 +174,68 @@ class EditOpenStepsWindow(tk.Toplevel):
         value_entry = AutocompleteCombobox(self.step_frame, textvariable=value_var, values=SPECIAL_KEYS)
         value_entry.grid(row=row, column=1, padx=5, pady=5)
 
-        delete_button = ttk.Button(self.step_frame, text="-", command=lambda: self.delete_step(row))
+        record = {"action": action_var, "value": value_var,
+                  "widgets": (action_menu, value_entry)}
+        delete_button = ttk.Button(self.step_frame, text="-", command=lambda: self.delete_step(record))
         delete_button.grid(row=row, column=2, padx=5, pady=5)
+        record["widgets"] += (delete_button,)
+
+        self.entries.append(record)
 
-        self.entries.append({"action": action_var, "value": value_var})
+    def _create_pending_rows(self, limit=ROW_BATCH_SIZE):
+        """
+        Create rows for up to limit pending steps (all of them if limit is None).
+
+        Reschedules itself on idle while steps remain.
+        """
+        self._pending_id = None
+        for count, step in enumerate(self._pending_steps, start=1):
+            self.add_step_widgets(step)
+            if limit is not None and count >= limit:
+                self._pending_id = self.after_idle(self._create_pending_rows)
+                return
+
+    def flush_pending_rows(self):
+        """
+        Create the rows of all remaining pending steps immediately.
+        """
+        if self._pending_id:
+            self.after_cancel(self._pending_id)
+        self._create_pending_rows(limit=None)
 
     def add_step(self):
+        self.flush_pending_rows()  # Keep rows in the same order as open_steps
         self.open_steps.append({"action": "", "value": ""})
         self.add_step_widgets({"action": "", "value": ""})
 
-    def delete_step(self, index):
-        del self.open_steps[index - 1]
-        for widget in self.step_frame.grid_slaves():
-            if int(widget.grid_info()["row"]) == index:
-                widget.destroy()
+    def delete_step(self, record):
+        index = self.entries.index(record)
+        del self.open_steps[index]
+        del self.entries[index]
+        for widget in record["widgets"]:
+            widget.destroy()
 
-        self.entries.pop(index - 1)
-        for row, entry in enumerate(self.entries, start=1):
-            entry["action"].widget.grid(row=row, column=0)
-            entry["value"].widget.grid(row=row, column=1)
-            self.step_frame.grid_slaves(row=row, column=2)[0].grid(row=row, column=2)
+        # Move the rows below the deleted step up by one
+        for row, entry in enumerate(self.entries[index:], start=index + 1):
+            for widget in entry["widgets"]:
+                widget.grid_configure(row=row)
 
     def save(self):
+        self.flush_pending_rows()
+        action_conv, value_conv = self._action_conv, self._value_conv
         self.open_steps = [
             {
-                "action": OPEN_STEP_SCHEMA["action"](entry["action"].get()),
-                "value": OPEN_STEP_SCHEMA["value"](entry["value"].get())
+                "action": action_conv(entry["action"].get()),
+                "value": value_conv(entry["value"].get())
             } for entry in self.entries
         ]
         self.save_callback(self.open_steps)
         self.on_close()
 
     def on_close(self):
+        if self._pending_id:
+            self.after_cancel(self._pending_id)
+            self._pending_id = None
         self.grab_release()
         self.destroy()
 
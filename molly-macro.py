@@ -3,9 +3,8 @@
 import sys
 import os
 import argparse
-import tempfile
+import atexit
 import time
-import pyautogui
 import pyperclip
 from base64 import b64encode
 from dotenv import load_dotenv
@@ -13,6 +12,9 @@ import shlex
 import subprocess
 import json
 import logging
+import mimetypes
+import re
+import shutil
 
 # Load environment variables from .env file
 load_dotenv()
@@ -29,21 +31,69 @@ config = {}
 app_config = {}
 DEBUG = False
 USE_CLIPBOARD = False
+# Type text through a long-running dotool process instead of one xdotool call per chunk
+USE_DOTOOL = os.getenv("USE_DOTOOL", "").lower() in ("1", "true", "yes")
 
-def debug_log(message):
+# Application settings that fall back to .env values, read once at import
+ENV_DEFAULTS = {key: os.getenv(key) for key in
+                ["WINDOW_TITLE", "DELAY_BETWEEN_KEYS", "DELAY_BETWEEN_COMMANDS",
+                 "DELAY_BETWEEN_APPLICATIONS", "APP_LOAD_TIME", "CHUNK_SIZE", "DELAY_BETWEEN_CHUNKS"]}
+
+# Read buffer for streamed input files, so small chunks don't each cost a read syscall
+FILE_BUFFER_SIZE = 1024 * 1024
+
+# Largest piece of text put on the clipboard for a single paste
+CLIPBOARD_CHUNK_SIZE = 1024 * 1024
+
+# Seconds to leave the clipboard untouched after a paste. The paste key returns once
+# it is sent, not once the target has read the clipboard.
+PASTE_SETTLE_TIME = 0.25
+
+# Smallest change in percent worth reporting to the GUI; it only shows one decimal.
+# This is the only progress throttle, the GUI shows every value it receives.
+PROGRESS_STEP = 0.5
+
+# Absolute path of xdotool, resolved once and used for every xdotool call. With an
+# absolute path (and close_fds=False), subprocess starts them with posix_spawn
+# instead of fork/exec.
+XDOTOOL = shutil.which("xdotool") or "xdotool"
+
+# Seconds to wait for a launched application's window, on top of its APP_LOAD_TIME
+WINDOW_SEARCH_TIMEOUT = 10
+
+# Characters with a special meaning in the POSIX extended regex xdotool search uses
+WINDOW_PATTERN_SPECIAL_RE = re.compile(r'([\\.^$|?*+()\[\]{}])')
+
+# ID of the window most recently activated by activate_window
+_last_active_window_id = None
+
+# Parsed configuration files keyed by resolved path, with the mtime they were read at
+_config_cache = {}
+
+# The dotool process text is streamed to when USE_DOTOOL is set
+_dotool_process = None
+
+# xdotool type commands by window ID; the text goes to stdin, so the command never changes
+_type_commands = {}
+
+def debug_log(message, *args):
     """
     Log debug messages if debug mode is enabled.
 
     Args:
-        message (str): The message to log.
+        message (str): The message to log, optionally with %-style placeholders.
+        *args: Values for the placeholders, formatted only if the message is logged.
     """
     if DEBUG:
-        logger.debug(message)
+        logger.debug(message, *args)
 
 def read_config(config_path):
     """
     Read and parse the JSON configuration file.
 
+    The parsed result is cached per file and reused until the file's
+    modification time changes.
+
     Args:
         config_path (str): Path to the JSON configuration file.
 
@@ -53,9 +103,18 @@ def read_config(config_path):
     Raises:
         SystemExit: If the configuration file cannot be read or parsed.
     """
+    # Resolve '~' and symlinks so every spelling of the same file shares one cache entry
+    cache_key = os.path.realpath(os.path.expanduser(config_path))
     try:
-        with open(config_path, 'r') as config_file:
+        mtime = os.path.getmtime(cache_key)
+        cached = _config_cache.get(cache_key)
+        if cached and cached[0] == mtime:
+            debug_log(f"Using cached configuration for {config_path}")
+            return cached[1]
+
+        with open(cache_key, 'r') as config_file:
             config = json.load(config_file)
+        _config_cache[cache_key] = (mtime, config)
         debug_log(f"Configuration loaded from {config_path}")
         return config
     except json.JSONDecodeError as e:
@@ -65,6 +124,20 @@ def read_config(config_path):
         logger.error(f"Failed to read configuration file: {e}")
         sys.exit(1)
 
+def get_app_config(config_path, config_name):
+    """
+    Get one application's settings from the (cached) configuration file.
+
+    Args:
+        config_path (str): Path to the JSON configuration file.
+        config_name (str): Name of the application configuration.
+
+    Returns:
+        dict: A copy of the application's settings, empty if it is not defined.
+    """
+    # Copy so that callers can adjust the settings without modifying the cached configuration
+    return dict(read_config(config_path)['applications'].get(config_name, {}))
+
 def load_config(config_path, config_name):
     """
     Load configuration from a JSON file and update global variables.
@@ -77,23 +150,25 @@ def load_config(config_path, config_name):
         SystemExit: If configuration loading fails.
     """
     global config, app_config
+    config = read_config(config_path)
     try:
-        with open(config_path, 'r') as config_file:
-            config = json.load(config_file)
-
-        app_config = config['applications'].get(config_name, {})
+        app_config = get_app_config(config_path, config_name)
 
         # Load settings from config, use .env values as defaults
-        for key in ["WINDOW_TITLE", "DELAY_BETWEEN_KEYS", "DELAY_BETWEEN_COMMANDS",
-                    "DELAY_BETWEEN_APPLICATIONS", "APP_LOAD_TIME", "CHUNK_SIZE", "DELAY_BETWEEN_CHUNKS"]:
-            if key not in app_config:
-                app_config[key] = os.getenv(key)
+        for key, default in ENV_DEFAULTS.items():
+            app_config.setdefault(key, default)
 
         # Convert numeric values to appropriate types
         for key in ["DELAY_BETWEEN_KEYS", "DELAY_BETWEEN_COMMANDS", "DELAY_BETWEEN_APPLICATIONS",
-                    "APP_LOAD_TIME", "CHUNK_SIZE", "DELAY_BETWEEN_CHUNKS"]:
+                    "APP_LOAD_TIME", "DELAY_BETWEEN_CHUNKS"]:
             if key in app_config:
                 app_config[key] = float(app_config[key])
+        app_config["CHUNK_SIZE"] = int(float(app_config["CHUNK_SIZE"]))
+        # xdotool takes the delay between keystrokes in milliseconds
+        app_config["DELAY_BETWEEN_KEYS_MS"] = str(int(app_config["DELAY_BETWEEN_KEYS"] * 1000))
+        # Tokenize the launch command once; it is stored as a shell-style string in the config
+        if isinstance(app_config.get("launch_command"), str):
+            app_config["launch_command"] = shlex.split(app_config["launch_command"])
 
         logger.debug(f"Loaded configuration for {config_name}: {app_config}")
     except Exception as e:
@@ -112,39 +187,21 @@ def execute_steps(window_id, steps):
         bool: True if all steps executed successfully, False otherwise.
     """
     debug_log(f"Executing steps for window ID: {window_id}")
+    delay_between_commands = app_config["DELAY_BETWEEN_COMMANDS"]
+    activate = True  # The window only needs to be activated before the first step
     for step in steps:
         action = step['action']
         value = step.get('value', '')
         debug_log(f"Executing step: Action: {action}, Value: {value}")
         if action == 'launch_window':
             continue  # launch_window is handled separately
-        if not send_command_to_window(window_id, action, value):
+        if not send_command_to_window(window_id, action, value, activate=activate):
             logger.error(f"Failed to execute step: {step}")
             return False
+        activate = False
+        time.sleep(delay_between_commands)
     return True
 
-def convert_to_xdotool_key(char):
-    """
-    Convert a character to its corresponding xdotool key.
-
-    Args:
-        char (str): The character to convert.
-
-    Returns:
-        str: The xdotool key representation of the character.
-    """
-    mapping = {
-        ' ': 'space', '!': 'exclam', '"': 'quotedbl', '#': 'numbersign', '$': 'dollar',
-        '%': 'percent', '&': 'ampersand', "'": 'apostrophe', '(': 'parenleft', ')': 'parenright',
-        '*': 'asterisk', '+': 'plus', ',': 'comma', '-': 'minus', '.': 'period',
-        '/': 'slash', '\\': 'backslash', ':': 'colon', ';': 'semicolon', '<': 'less',
-        '=': 'equal', '>': 'greater', '?': 'question', '@': 'at', '[': 'bracketleft',
-        ']': 'bracketright', '^': 'asciicircum', '_': 'underscore', '`': 'grave',
-        '{': 'braceleft', '|': 'bar', '}': 'braceright', '~': 'asciitilde',
-        '\n': 'Return'
-    }
-    return mapping.get(char, char)
-
 def generate_xdotool_command(window_id, action, value):
     """
     Generate an xdotool command based on the action and value.
@@ -152,24 +209,90 @@ def generate_xdotool_command(window_id, action, value):
     Args:
         window_id (str): The ID of the window to operate on.
         action (str): The action to perform.
-        value (str): The value associated with the action.
+        value (str): The value associated with the action. For "type" the text is
+            not part of the command; it must be written to xdotool's stdin.
 
     Returns:
-        list: A list of command arguments for subprocess.
+        list: A list of command arguments for subprocess. The "type" command is built
+            once per window and shared, so it must not be modified.
 
     Raises:
         ValueError: If an unsupported action is provided.
     """
     if action == "type":
-        return ['xdotool', 'type', '--window', window_id, value]
+        command = _type_commands.get(window_id)
+        if command is None:
+            command = _type_commands[window_id] = [XDOTOOL, 'type', '--delay', app_config["DELAY_BETWEEN_KEYS_MS"],
+                                                   '--window', window_id, '--file', '-']
+        return command
     elif action == "key":
-        return ['xdotool', 'key', '--window', window_id, value]
+        return [XDOTOOL, 'key', '--delay', app_config["DELAY_BETWEEN_KEYS_MS"], '--window', window_id, value]
     elif action == "raise_window":
-        return ['xdotool', 'windowraise', window_id]
+        return [XDOTOOL, 'windowraise', window_id]
     else:
         raise ValueError(f"Unsupported action: {action}")
 
-def send_command_to_window(window_id, action, value=None):
+def get_dotool_process():
+    """
+    Get the running dotool process, starting it on first use.
+
+    Returns:
+        subprocess.Popen: The dotool process, reading commands from its stdin.
+    """
+    global _dotool_process
+    if _dotool_process is None:
+        debug_log("Starting dotool")
+        _dotool_process = subprocess.Popen(['dotool'], stdin=subprocess.PIPE, text=True)
+        _dotool_process.stdin.write(f"typedelay {app_config['DELAY_BETWEEN_KEYS_MS']}\n")
+        # Queued text must not be cut off when the script exits early
+        atexit.register(close_dotool_process)
+    return _dotool_process
+
+def close_dotool_process():
+    """
+    Wait for dotool to type everything it was sent, then stop it.
+
+    Does nothing if dotool is not running.
+
+    Returns:
+        bool: True if dotool typed all of its input (or was not running), False otherwise.
+    """
+    global _dotool_process
+    if _dotool_process is None:
+        return True
+    process, _dotool_process = _dotool_process, None
+    debug_log("Waiting for dotool to finish typing")
+    try:
+        process.stdin.close()
+    except OSError as e:
+        logger.error(f"Failed to send text to dotool: {e}")
+    returncode = process.wait()
+    if returncode != 0:
+        logger.error(f"dotool exited with status {returncode}")
+        return False
+    return True
+
+def type_with_dotool(text):
+    """
+    Queue text to be typed by dotool into the focused window.
+
+    dotool types a 'type' command up to the end of its line, so newlines are sent
+    as Enter key presses.
+
+    Args:
+        text (str): The text to type.
+    """
+    commands = []
+    for index, line in enumerate(text.split('\n')):
+        if index:
+            commands.append("key enter\n")
+        if line:
+            commands.append(f"type {line}\n")
+    process = get_dotool_process()
+    process.stdin.write(''.join(commands))
+    process.stdin.flush()
+
+def send_command_to_window(window_id, action, value=None, activate=True):
     """
     Send a command to a specified window using xdotool.
 
@@ -177,73 +300,95 @@ def send_command_to_window(window_id, action, value=None):
         window_id (str): The ID of the window to operate on.
         action (str): The action to perform.
         value (str, optional): The value associated with the action.
+        activate (bool, optional): Activate the window once before sending. Callers that
+            have already activated the window pass False.
 
     Returns:
         bool: True if the command was sent successfully, False otherwise.
     """
-    debug_log(f"Sending command to window {window_id}: Action: {action}, Value: {value}")
+    debug_log("Sending command to window %s: Action: %s, Value: %s", window_id, action, value)
     try:
-        if action == "type":
-            for i in range(0, len(value), int(app_config["CHUNK_SIZE"])):
-                chunk = value[i:i + int(app_config["CHUNK_SIZE"])]
-                command = generate_xdotool_command(window_id, action, chunk)
-                command_str = ' '.join(command)
-                debug_log(f"Sending chunk: {chunk}")
-                debug_log(f"xdotool command: {command_str}")
-                if not activate_window(window_id):
-                    logger.error("Failed to activate window before sending command")
-                    return False
-                result = subprocess.run(command, check=True, capture_output=True, text=True)
-                debug_log(f"Executed command: {command_str}")
-                debug_log(f"Command output: {result.stdout}")
-                time.sleep(app_config["DELAY_BETWEEN_CHUNKS"])
-        else:
+        if activate and not activate_window(window_id):
+            logger.error("Failed to activate window before sending command")
+            return False
+
+        if action == "type" and USE_DOTOOL:
+            # dotool types into whichever window has focus, which was set by activation
+            type_with_dotool(value)
+        elif action == "type":
             command = generate_xdotool_command(window_id, action, value)
-            command_str = ' '.join(command)
-            debug_log(f"xdotool command: {command_str}")
-            if not activate_window(window_id):
-                logger.error("Failed to activate window before sending command")
+            debug_log("xdotool command: %s", command)
+            # The whole text is typed by one xdotool call. It is piped in so text starting
+            # with '-' is never parsed as an option. xdotool prints nothing on success, so
+            # only stderr is captured for error reporting. Descriptors Python opens are not
+            # inheritable, so there is nothing for close_fds to sweep in the child.
+            subprocess.run(command, input=value, check=True, stdout=subprocess.DEVNULL,
+                           stderr=subprocess.PIPE, text=True, close_fds=False)
+        else:
+            # Let dotool finish any queued text so keys arrive in order
+            if not close_dotool_process():
                 return False
-            result = subprocess.run(command, check=True, capture_output=True, text=True)
-            debug_log(f"Executed command: {command_str}")
-            debug_log(f"Command output: {result.stdout}")
-
-        time.sleep(app_config["DELAY_BETWEEN_COMMANDS"])
+            command = generate_xdotool_command(window_id, action, value)
+            debug_log("xdotool command: %s", command)
+            subprocess.run(command, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+                           close_fds=False)
         return True
     except subprocess.CalledProcessError as e:
         logger.error(f"Error executing command for window ID {window_id}")
         logger.error(f"Command failed: {e}")
         logger.error(f"Error output: {e.stderr}")
         return False
+    except OSError as e:
+        logger.error(f"Failed to send text to dotool: {e}")
+        return False
 
 def activate_window(window_id):
     """
     Activate, focus, and raise the target window.
 
+    If this window was the last one activated and is still the active window,
+    the activation is skipped.
+
     Args:
         window_id (str): The ID of the window to activate.
 
     Returns:
         bool: True if the window was successfully activated, False otherwise.
     """
+    global _last_active_window_id
+    if _last_active_window_id == window_id:
+        active_window = subprocess.run([XDOTOOL, 'getactivewindow'],
+                                       check=False, capture_output=True, text=True, close_fds=False)
+        if active_window.stdout.strip() == window_id:
+            debug_log(f"Window {window_id} is already active")
+            return True
+
     debug_log(f"Activating window {window_id}")
     try:
         # First, try to activate the window
-        result = subprocess.run(['xdotool', 'windowactivate', '--sync', window_id],
-                                check=False, capture_output=True, text=True)
+        result = subprocess.run([XDOTOOL, 'windowactivate', '--sync', window_id], check=False,
+                                stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, close_fds=False)
         if result.returncode != 0:
             logger.warning(f"Failed to activate window: {result.stderr}")
-            # If activation fails, try to map the window first
-            subprocess.run(['xdotool', 'windowmap', window_id], check=False)
-            time.sleep(0.5)  # Give it a moment to map
-            result = subprocess.run(['xdotool', 'windowactivate', '--sync', window_id],
-                                    check=False, capture_output=True, text=True)
-
-        # After activation, try to focus and raise the window
-        subprocess.run(['xdotool', 'windowfocus', window_id], check=False)
-        subprocess.run(['xdotool', 'windowraise', window_id], check=False)
+            # If activation fails, try to map the window first; --sync waits until it is mapped
+            try:
+                subprocess.run([XDOTOOL, 'windowmap', '--sync', window_id], check=False, timeout=5,
+                               close_fds=False)
+            except subprocess.TimeoutExpired:
+                logger.warning(f"Timed out waiting for window {window_id} to map")
+            result = subprocess.run([XDOTOOL, 'windowactivate', '--sync', window_id], check=False,
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+                                    close_fds=False)
+
+        # After activation, try to focus and raise the window. The two calls are
+        # independent, so run them side by side and wait for both.
+        helpers = [subprocess.Popen([XDOTOOL, subcommand, window_id], close_fds=False)
+                   for subcommand in ('windowfocus', 'windowraise')]
+        for helper in helpers:
+            helper.wait()
 
         logger.info(f"Attempted to activate, focus, and raise window {window_id}")
+        _last_active_window_id = window_id
         return True
     except subprocess.CalledProcessError as e:
         logger.error(f"Failed to activate window {window_id}: {e}")
@@ -254,7 +399,7 @@ def launch_application(command, config):
     Launch an application and find its window ID.
 
     Args:
-        command (str): The command to launch the application.
+        command (list): The command to launch the application, as an argument list.
         config (dict): The configuration dictionary for the application.
 
     Returns:
@@ -263,16 +408,13 @@ def launch_application(command, config):
     debug_log(f"Launching application with command: {command}")
     try:
         # Use subprocess.Popen with preexec_fn to detach the process
-        process = subprocess.Popen(shlex.split(command),
+        process = subprocess.Popen(command,
                                    start_new_session=True,
                                    stdout=subprocess.DEVNULL,
                                    stderr=subprocess.DEVNULL)
         debug_log(f"Application process started with PID: {process.pid}")
 
-        # Wait for the application to load
         app_load_time = float(config.get("APP_LOAD_TIME", 5.0))
-        debug_log(f"Waiting {app_load_time} seconds for application to load")
-        time.sleep(app_load_time)
 
         # Attempt to find the window ID using the window_match pattern from the config
         window_match = config.get("window_match")
@@ -280,21 +422,26 @@ def launch_application(command, config):
             logger.error("No window_match pattern specified in the configuration")
             return None
 
-        for attempt in range(10):  # Retry up to 10 times
-            debug_log(f"Attempt {attempt + 1} to find window ID")
-            time.sleep(1)  # Wait a moment before retrying
-            result = subprocess.run(['xdotool', 'search', '--onlyvisible', '--name', window_match],
-                                    check=False, capture_output=True, text=True)
-            window_ids = result.stdout.split()
-            debug_log(f"Found {len(window_ids)} visible windows")
-            for window_id in window_ids:
-                title_result = subprocess.run(['xdotool', 'getwindowname', window_id],
-                                              check=False, capture_output=True, text=True)
-                window_title = title_result.stdout.strip()
-                debug_log(f"Checking window: ID={window_id}, Title='{window_title}'")
-                if window_match in window_title:
-                    logger.info(f"Found window ID for '{window_title}': {window_id}")
-                    return window_id
+        # --sync makes xdotool block until a matching window exists. window_match is a
+        # plain substring of the title, so it is escaped before xdotool treats it as a regex.
+        debug_log(f"Waiting for a visible window matching '{window_match}'")
+        pattern = WINDOW_PATTERN_SPECIAL_RE.sub(r'\\\1', window_match)
+        try:
+            result = subprocess.run([XDOTOOL, 'search', '--sync', '--onlyvisible', '--name', pattern],
+                                    check=False, capture_output=True, text=True, close_fds=False,
+                                    timeout=app_load_time + WINDOW_SEARCH_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            logger.error("Timed out waiting for the launched application's window")
+            return None
+
+        window_ids = result.stdout.split()
+        if window_ids:
+            logger.info(f"Found window ID for '{window_match}': {window_ids[0]}")
+            # The window can appear before the application accepts input, so the
+            # open steps only start once APP_LOAD_TIME has passed
+            debug_log(f"Waiting {app_load_time} seconds for application to load")
+            time.sleep(app_load_time)
+            return window_ids[0]
 
         logger.error("Failed to find window ID for the launched application")
         return None
@@ -317,22 +464,91 @@ def get_clipboard_content():
         logger.error(f"Failed to get clipboard content: {e}")
         return ""
 
-def send_text_to_window(window_id, text):
+def iter_file_chunks(file_path, chunk_size):
+    """
+    Read a text file in chunks without loading the whole file into memory.
+
+    Args:
+        file_path (str): Path to the file.
+        chunk_size (int): Maximum number of characters per chunk.
+
+    Yields:
+        str: Successive chunks of the file content.
+    """
+    with open(file_path, 'r', encoding='utf-8', buffering=FILE_BUFFER_SIZE) as file:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+def send_file_to_window(window_id, file_path):
+    """
+    Send the content of a text file to the target window, streaming it chunk by chunk.
+
+    Args:
+        window_id (str): The ID of the window to send the file to.
+        file_path (str): Path to the file.
+
+    Returns:
+        bool: True if the file was sent successfully, False otherwise.
+    """
+    try:
+        total_length = os.path.getsize(file_path)
+    except OSError as e:
+        logger.error(f"Failed to read file: {e}")
+        return False
+    return send_text_to_window(window_id, iter_file_chunks(file_path, app_config["CHUNK_SIZE"]), total_length)
+
+def report_progress(chars_sent, total_length, last_reported):
+    """
+    Print a PROGRESS line if progress has moved by at least PROGRESS_STEP.
+
+    Args:
+        chars_sent (int): Amount of the payload sent so far.
+        total_length (int): Total size of the payload.
+        last_reported (float): The progress value printed last.
+
+    Returns:
+        float: The progress value printed last, after this call.
+    """
+    # A file's size is in bytes, so cap the character-based progress at 100%
+    progress = min(chars_sent / total_length, 1.0) * 100
+    if progress - last_reported < PROGRESS_STEP and progress < 100:
+        return last_reported
+    print(f"PROGRESS:{progress:.2f}", flush=True)
+    return progress
+
+def send_text_to_window(window_id, text, total_length=None):
     """
     Send text to the target window, handling special characters and preserving formatting.
 
     Args:
         window_id (str): The ID of the window to send text to.
-        text (str): The text to send.
+        text (str or iterable): The text to send, or an iterable of text chunks
+            (such as iter_file_chunks) that are sent as they are produced.
+        total_length (int, optional): Total size of the chunked text, used for progress
+            reporting. Ignored when text is a string.
 
     Returns:
         bool: True if the text was sent successfully, False otherwise.
     """
+    chunk_size = app_config["CHUNK_SIZE"]
+    delay_between_chunks = app_config["DELAY_BETWEEN_CHUNKS"]
+    if isinstance(text, str):
+        # xdotool type sends '\n' as Return itself; normalize Windows/old Mac line endings so a
+        # chunk never needs separate key events (files get this from universal newline mode)
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        total_length = len(text)
+        debug_log(f"First 100 characters of text: {text[:100]}")
+        chunks = (text[start:start + chunk_size] for start in range(0, total_length, chunk_size))
+    else:
+        chunks = text
     debug_log(f"Starting to send text to window {window_id}")
-    debug_log(f"Text length: {len(text)}")
-    debug_log(f"First 100 characters of text: {text[:100]}")
+    debug_log(f"Text length: {total_length}")
 
-    if not text:
+    if not total_length:
         logger.error("No text to send")
         return False
 
@@ -341,13 +557,16 @@ def send_text_to_window(window_id, text):
         logger.error("Failed to activate window before sending text")
         return False
 
-    # Ensure the window is focused
-    subprocess.run(['xdotool', 'windowfocus', window_id], check=True)
-    time.sleep(0.5)  # Short delay to ensure the window is ready
+    # Ensure the window is focused; --sync returns once it has focus
+    try:
+        subprocess.run([XDOTOOL, 'windowfocus', '--sync', window_id], check=True, timeout=5,
+                       close_fds=False)
+    except subprocess.TimeoutExpired:
+        logger.warning(f"Timed out waiting for window {window_id} to take focus")
 
     # Check if the window is still active right before sending text
-    active_window = subprocess.run(['xdotool', 'getactivewindow'],
-                                   check=False, capture_output=True, text=True)
+    active_window = subprocess.run([XDOTOOL, 'getactivewindow'],
+                                   check=False, capture_output=True, text=True, close_fds=False)
     if active_window.stdout.strip() != window_id:
         logger.warning(f"Window {window_id} is not the active window before sending text")
         # Attempt to reactivate the window
@@ -355,27 +574,29 @@ def send_text_to_window(window_id, text):
             logger.error("Failed to reactivate window before sending text")
             return False
 
-    total_length = len(text)
     chars_sent = 0
+    last_reported = 0.0
 
     try:
-        for char in text:
-            if char == '\n':
-                xdotool_key = 'Return'
+        # Each chunk is typed by a single xdotool call, which applies DELAY_BETWEEN_KEYS itself
+        for chunk in chunks:
+            if not send_command_to_window(window_id, "type", chunk, activate=False):
+                logger.error(f"Failed to send text starting at character {chars_sent}")
+                return False
+            chars_sent += len(chunk)
+            time.sleep(delay_between_chunks)
+            if USE_DOTOOL:
+                # dotool has only been handed the text. Its stdin pipe keeps it at most a
+                # pipe buffer ahead, but 100% is held back until it has typed everything.
+                last_reported = report_progress(min(chars_sent, total_length - 1), total_length, last_reported)
             else:
-                xdotool_key = convert_to_xdotool_key(char)
+                last_reported = report_progress(chars_sent, total_length, last_reported)
+            debug_log("Sent %d/%d characters", chars_sent, total_length)
 
-            debug_log(f"Sending character: {char} (converted to: {xdotool_key})")
-            success = send_command_to_window(window_id, "key", xdotool_key)
-            if not success:
-                logger.error(f"Failed to send character: {char}")
+        if USE_DOTOOL:
+            if not close_dotool_process():
                 return False
-            time.sleep(app_config["DELAY_BETWEEN_KEYS"])
-            chars_sent += 1
-            if chars_sent % 100 == 0 or chars_sent == total_length:
-                progress = (chars_sent / total_length) * 100
-                print(f"PROGRESS:{progress:.2f}", flush=True)
-                debug_log(f"Sent {chars_sent}/{total_length} characters. Progress: {progress:.2f}%")
+            report_progress(total_length, total_length, last_reported)
 
         debug_log("Finished sending text to window")
         return True
@@ -383,6 +604,170 @@ def send_text_to_window(window_id, text):
         logger.error(f"Error sending text: {e}")
         return False
 
+def paste_text_to_window(window_id, text=None, total_length=None):
+    """
+    Paste text into the target window through the clipboard.
+
+    Text longer than CLIPBOARD_CHUNK_SIZE is pasted in several pieces. When text is
+    given, the previous clipboard content is restored afterwards.
+
+    Args:
+        window_id (str): The ID of the window to paste into.
+        text (str or iterable, optional): The text to paste, or an iterable of text
+            chunks that are pasted one at a time. If omitted, the current clipboard
+            content is pasted as is.
+        total_length (int, optional): Total size of the chunked text, used for progress
+            reporting. Ignored when text is a string.
+
+    Returns:
+        bool: True if the text was pasted successfully, False otherwise.
+    """
+    paste_key = app_config.get("paste_key") or "ctrl+v"
+    if text is None:
+        debug_log(f"Pasting clipboard content into window {window_id}")
+        return send_command_to_window(window_id, "key", paste_key)
+
+    if isinstance(text, str):
+        total_length = len(text)
+        chunks = (text[start:start + CLIPBOARD_CHUNK_SIZE] for start in range(0, total_length, CLIPBOARD_CHUNK_SIZE))
+    else:
+        chunks = text
+    if not total_length:
+        logger.error("No text to paste")
+        return False
+
+    chars_sent = 0
+    last_reported = 0.0
+    activate = True
+    try:
+        original_clipboard = pyperclip.paste()
+    except Exception as e:
+        logger.warning(f"Failed to read clipboard content, it will not be restored: {e}")
+        original_clipboard = None
+    try:
+        for chunk in chunks:
+            pyperclip.copy(chunk)
+            debug_log(f"Pasting {len(chunk)} characters into window {window_id}")
+            if not send_command_to_window(window_id, "key", paste_key, activate=activate):
+                return False
+            activate = False
+            # The target reads the clipboard asynchronously; give it time before the
+            # next chunk, or the restored content, replaces this one
+            time.sleep(PASTE_SETTLE_TIME)
+            chars_sent += len(chunk)
+            last_reported = report_progress(chars_sent, total_length, last_reported)
+            time.sleep(app_config["DELAY_BETWEEN_CHUNKS"])
+        return True
+    except Exception as e:
+        logger.error(f"Error pasting text: {e}")
+        return False
+    finally:
+        if original_clipboard is not None:
+            try:
+                pyperclip.copy(original_clipboard)
+            except Exception as e:
+                logger.warning(f"Failed to restore clipboard content: {e}")
+
+def send_payload(window_id, text=None, file_path=None):
+    """
+    Send the clipboard text or a file to the target window.
+
+    The payload is typed unless the application configuration sets paste_payload,
+    in which case it is pasted through the clipboard in one keystroke.
+
+    Args:
+        window_id (str): The ID of the window to send the payload to.
+        text (str, optional): Clipboard content to send.
+        file_path (str, optional): Path to a file to send, used when text is None.
+
+    Returns:
+        bool: True if the payload was sent successfully, False otherwise.
+    """
+    if not app_config.get("paste_payload", False):
+        if text is not None:
+            return send_text_to_window(window_id, text)
+        return send_file_to_window(window_id, file_path)
+
+    if text is not None:
+        # The payload came from the clipboard, so it only needs to be pasted
+        return paste_text_to_window(window_id)
+    try:
+        total_length = os.path.getsize(file_path)
+    except OSError as e:
+        logger.error(f"Failed to read file: {e}")
+        return False
+    # Stream the file onto the clipboard piece by piece rather than reading it whole
+    return paste_text_to_window(window_id, iter_file_chunks(file_path, CLIPBOARD_CHUNK_SIZE), total_length)
+
+def iter_base64_chunks(file_path, chunk_size):
+    """
+    Base64-encode a binary file in chunks without loading the whole file into memory.
+
+    Args:
+        file_path (str): Path to the file.
+        chunk_size (int): Maximum number of encoded characters per chunk.
+
+    Yields:
+        str: Successive chunks of the encoded file content.
+    """
+    # Every 3 input bytes encode to 4 characters, so whole groups of 3 bytes per read
+    # keep the chunks free of padding until the end of the file
+    read_size = max(chunk_size // 4, 1) * 3
+    with open(file_path, 'rb', buffering=FILE_BUFFER_SIZE) as file:
+        while True:
+            data = file.read(read_size)
+            if not data:
+                return
+            yield b64encode(data).decode('ascii')
+
+def paste_image_to_window(window_id, file_path):
+    """
+    Paste an image file into the target window as an image through the clipboard.
+
+    Args:
+        window_id (str): The ID of the window to paste into.
+        file_path (str): Path to the image file.
+
+    Returns:
+        bool: True if the image was pasted successfully, False otherwise.
+    """
+    mime_type = mimetypes.guess_type(file_path)[0] or "image/png"
+    debug_log(f"Copying {file_path} to the clipboard as {mime_type}")
+    try:
+        # xclip reads the file itself and stays in the background to serve the selection,
+        # so its output must not be piped or run() would wait for it
+        subprocess.run(['xclip', '-selection', 'clipboard', '-t', mime_type, '-i', file_path],
+                       check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except (OSError, subprocess.CalledProcessError) as e:
+        logger.error(f"Failed to copy image to clipboard: {e}")
+        return False
+    return paste_text_to_window(window_id)
+
+def send_image_to_window(window_id, file_path):
+    """
+    Send an image file to the target window as base64 text, streaming it chunk by chunk.
+
+    When the application configuration sets paste_payload, the image itself is
+    pasted through the clipboard instead.
+
+    Args:
+        window_id (str): The ID of the window to send the image to.
+        file_path (str): Path to the image file.
+
+    Returns:
+        bool: True if the image was sent successfully, False otherwise.
+    """
+    try:
+        size = os.path.getsize(file_path)
+    except OSError as e:
+        logger.error(f"Failed to read image: {e}")
+        return False
+    if app_config.get("paste_payload", False):
+        return paste_image_to_window(window_id, file_path)
+    total_length = (size + 2) // 3 * 4
+    debug_log(f"Encoded image is {total_length} characters")
+    return send_text_to_window(window_id, iter_base64_chunks(file_path, app_config["CHUNK_SIZE"]), total_length)
+
 def main():
     """
     Main function to handle command-line arguments and execute the appropriate actions.
@@ -438,10 +823,6 @@ def main():
         clipboard_content = ""
         file_path = ""
 
-    # Read configuration
-    config = read_config(args.config)
-    debug_log(f"Configuration loaded from {args.config}")
-
     if not args.config_name:
         logger.error("No configuration name specified")
         sys.exit(1)
@@ -480,6 +861,10 @@ def main():
     # Check if payload should be sent
     if app_config.get("no_payload", False):
         logger.info("No payload option set to true. Skipping content transfer.")
+        # Typed open steps may still be queued in dotool
+        if not close_dotool_process():
+            logger.error("Failed to execute open steps")
+            sys.exit(1)
         print("PROGRESS:100.00", flush=True)  # Indicate completion
         logger.info("Operation completed successfully without sending payload")
         sys.exit(0)
@@ -495,34 +880,47 @@ def main():
     # Execute mode-specific operations
     if mode == "spreadsheet":
         debug_log("Entering spreadsheet mode")
+        # Tab-separated rows go in as one paste when paste_payload is set
         if USE_CLIPBOARD:
-            clipboard_content = get_clipboard_content()
             if clipboard_content:
                 debug_log("Sending clipboard content to spreadsheet")
-                send_text_to_window(WINDOW_ID, clipboard_content)
+                sent = send_payload(WINDOW_ID, text=clipboard_content)
             else:
                 logger.error("No clipboard content to send")
+                sent = False
         else:
-            with open(file_path, 'r') as file:
-                file_content = file.read()
             debug_log("Sending file content to spreadsheet")
-            send_text_to_window(WINDOW_ID, file_content)
+            sent = send_payload(WINDOW_ID, file_path=file_path)
     elif mode == "text":
         debug_log("Entering text mode")
-        content = clipboard_content if USE_CLIPBOARD else open(file_path).read()
-        send_text_to_window(WINDOW_ID, content)
+        if USE_CLIPBOARD:
+            sent = send_payload(WINDOW_ID, text=clipboard_content)
+        else:
+            sent = send_payload(WINDOW_ID, file_path=file_path)
     elif mode == "image":
         debug_log("Entering image mode")
-        logger.warning("Image mode not implemented yet")
-        # Image mode operations (to be implemented)
+        if USE_CLIPBOARD:
+            logger.error("Image mode needs an image file as input")
+            sent = False
+        else:
+            sent = send_image_to_window(WINDOW_ID, file_path)
     elif mode == "code":
         debug_log("Entering code mode")
-        content = clipboard_content if USE_CLIPBOARD else open(file_path).read()
-        send_text_to_window(WINDOW_ID, content)
+        if USE_CLIPBOARD:
+            sent = send_payload(WINDOW_ID, text=clipboard_content)
+        else:
+            sent = send_payload(WINDOW_ID, file_path=file_path)
     else:
         logger.error(f"Error: Invalid mode selected: {mode}")
         sys.exit(6)  # Invalid mode selected
 
+    if not sent:
+        logger.error("Data transfer failed")
+        sys.exit(1)
+
+    if not close_dotool_process():
+        logger.error("Failed to finish typing the payload")
+        sys.exit(1)
     print("PROGRESS:100.00", flush=True)  # Indicate completion
     logger.info("Data transfer completed successfully")
 
@@ -1,10 +1,20 @@
 import tkinter as tk
 
+# How long the pointer has to rest on a widget before its tooltip is shown
+TOOLTIP_DELAY_MS = 400
+
 class ToolTip:
     """
     A class to create and manage tooltips for Tkinter widgets.
+
+    Only one tooltip is visible at a time, so all instances share a single
+    tooltip window whose text is swapped for the widget being hovered.
     """
 
+    _shared_tooltip = None  # Created on first show, then hidden and reused by every instance
+    _shared_label = None
+    _owner = None  # Instance whose text the shared tooltip is currently showing
+
     def __init__(self, widget, text):
         """
         Initialize the ToolTip class.
@@ -15,10 +25,28 @@ class ToolTip:
         """
         self.widget = widget
         self.text = text
-        self.tooltip = None
-        widget.bind("<Enter>", self.show_tooltip)
+        self._show_after_id = None  # Pending delayed show
+        widget.bind("<Enter>", self.schedule_tooltip)
         widget.bind("<Leave>", self.hide_tooltip)
 
+    def schedule_tooltip(self, event=None):
+        """
+        Show the tooltip once the pointer has rested on the widget for TOOLTIP_DELAY_MS.
+
+        Args:
+            event (tk.Event, optional): The event that triggered the tooltip. Defaults to None.
+        """
+        self._cancel_scheduled()
+        self._show_after_id = self.widget.after(TOOLTIP_DELAY_MS, self.show_tooltip)
+
+    def _cancel_scheduled(self):
+        """
+        Cancel a pending delayed show, if any.
+        """
+        if self._show_after_id is not None:
+            self.widget.after_cancel(self._show_after_id)
+            self._show_after_id = None
+
     def show_tooltip(self, event=None):
         """
         Show the tooltip.
@@ -26,16 +54,23 @@ class ToolTip:
         Args:
             event (tk.Event, optional): The event that triggered the tooltip. Defaults to None.
         """
+        self._show_after_id = None
         x, y, _, _ = self.widget.bbox("insert")
         x += self.widget.winfo_rootx() + 25
         y += self.widget.winfo_rooty() + 25
-        self.tooltip = tk.Toplevel(self.widget)
-        self.tooltip.wm_overrideredirect(True)
-        self.tooltip.wm_geometry(f"+{x}+{y}")
-        label = tk.Label(self.tooltip, text=self.text, justify=tk.LEFT,
-                         background="#ffffe0", relief=tk.SOLID, borderwidth=1,
-                         font=("tahoma", "10", "normal"))
-        label.pack(ipadx=1)
+        tooltip = ToolTip._shared_tooltip
+        if tooltip is None or not tooltip.winfo_exists():
+            # Parented to the root window so it outlives any child window it was first shown for
+            tooltip = ToolTip._shared_tooltip = tk.Toplevel(self.widget.nametowidget("."))
+            tooltip.wm_overrideredirect(True)
+            ToolTip._shared_label = tk.Label(tooltip, justify=tk.LEFT,
+                                             background="#ffffe0", relief=tk.SOLID, borderwidth=1,
+                                             font=("tahoma", "10", "normal"))
+            ToolTip._shared_label.pack(ipadx=1)
+        ToolTip._owner = self
+        ToolTip._shared_label.config(text=self.text)
+        tooltip.wm_geometry(f"+{x}+{y}")
+        tooltip.deiconify()
 
     def hide_tooltip(self, event=None):
         """
@@ -44,6 +79,8 @@ class ToolTip:
         Args:
             event (tk.Event, optional): The event that triggered the tooltip. Defaults to None.
         """
-        if self.tooltip:
-            self.tooltip.destroy()
-            self.tooltip = None
\ No newline at end of file
+        self._cancel_scheduled()
+        if ToolTip._owner is self:
+            ToolTip._owner = None
+            if ToolTip._shared_tooltip.winfo_exists():
+                ToolTip._shared_tooltip.withdraw()